@@ -340,7 +340,7 @@ def fetch(  # noqa: PLR0913
         _print_preview(df)
 
     if summarize:
-        client.summarize(df)
+        client.summarize(df, console=console)
 
     _save_output(df, output, fmt)
 
@@ -449,7 +449,7 @@ def fetch_multi(  # noqa: PLR0913
         _print_preview(df)
 
     if summarize:
-        client.summarize(df)
+        client.summarize(df, console=console)
 
     _save_output(df, output, fmt)
 
@@ -576,7 +576,7 @@ def fetch_transect(  # noqa: PLR0913
         _print_preview(df)
 
     if summarize:
-        client.summarize(df)
+        client.summarize(df, console=console)
 
     _save_output(df, output, fmt)
 
@@ -28,31 +28,43 @@ import gzip
 import hashlib
 import json
 import logging
+import math
 import re
 import sqlite3
 import threading
 import time
 import warnings
+from collections import OrderedDict
 from collections.abc import Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 import pandas as pd
 import requests
 from pydantic import BaseModel, ConfigDict
 from requests.adapters import HTTPAdapter
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 from urllib3.util.retry import Retry
 
 from aidweather import __version__
 from aidweather.config import cfg
 from aidweather.geo import GeoCoordinate
 
+try:
+    # Optional speedup: orjson parses POWER payloads several times faster than
+    # the stdlib and decodes straight from bytes. Install with `aidweather[fast]`.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    # rich is only needed by PowerClient.summarize(); it is imported there so
+    # that `import aidweather` stays lean for headless/service use.
+    from rich.console import Console
+    from rich.table import Table
+
 __all__ = ["PowerClient"]
 
 
@@ -163,6 +175,22 @@ def _session_with_retries(
     return s
 
 
+# Shared by every PowerClient constructed without an explicit session, so that
+# short-lived clients (one per notebook cell or CLI call) reuse the same pooled
+# keep-alive connections instead of paying a fresh TCP/TLS handshake each.
+_DEFAULT_SESSION: requests.Session | None = None
+_DEFAULT_SESSION_LOCK = threading.Lock()
+
+
+def _get_default_session() -> requests.Session:
+    """Return the process-wide retry-enabled session, creating it on first use."""
+    global _DEFAULT_SESSION
+    with _DEFAULT_SESSION_LOCK:
+        if _DEFAULT_SESSION is None:
+            _DEFAULT_SESSION = _session_with_retries()
+        return _DEFAULT_SESSION
+
+
 # Configure logging for the module
 logger = logging.getLogger(__name__)
 
@@ -262,6 +290,21 @@ def _safe_payload_repr(payload: Any) -> str:
         return repr(payload)
 
 
+def _loads_json(raw: bytes | str) -> Any:
+    """Decode *raw* JSON with orjson when installed, else with the stdlib parser.
+
+    orjson is strict RFC 8259 and rejects the ``NaN``/``Infinity`` tokens the
+    stdlib both writes and accepts, so input it refuses is retried with the
+    stdlib parser. Invalid input raises :class:`json.JSONDecodeError` either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
 def _to_naive(ts: pd.Timestamp) -> pd.Timestamp:
     """Strip timezone info from a Timestamp, safe for already tz-naive values."""
     return ts.tz_localize(None) if ts.tzinfo is not None else ts
@@ -315,8 +358,16 @@ def _get_date_ranges_to_fetch(
     if cached_df is None or cached_df.empty:
         return [(requested_start, requested_end)]
 
-    cached_start = _to_naive(cached_df.index.min())
-    cached_end = _to_naive(cached_df.index.max())
+    # Cached frames come out of _response_to_dataframe / _merge_and_deduplicate
+    # already sorted, so the span is just the two ends of the index (pandas
+    # caches the monotonic flag); fall back to full scans for unsorted input.
+    cached_index = cached_df.index
+    if cached_index.is_monotonic_increasing:
+        cached_start = _to_naive(cached_index[0])
+        cached_end = _to_naive(cached_index[-1])
+    else:
+        cached_start = _to_naive(cached_index.min())
+        cached_end = _to_naive(cached_index.max())
     req_start = _to_naive(requested_start)
     req_end = _to_naive(requested_end)
 
@@ -335,17 +386,20 @@ def _get_date_ranges_to_fetch(
 def _convert_df_to_cacheable_json(
     df: pd.DataFrame, temporal_api: str
 ) -> dict[str, Any]:
-    """Convert a DataFrame back into the JSON dict format used for cache storage."""
-    df_copy = df.copy()
+    """Convert a DataFrame back into the JSON dict format used for cache storage.
+
+    *df* is not modified: ``fillna`` already returns a new frame, so no
+    defensive copy is taken before relabelling its index.
+    """
     date_format = "%Y%m%d%H" if temporal_api == "hourly" else "%Y%m%d"
-    df_copy.index = pd.DatetimeIndex(df_copy.index).strftime(date_format)
     # NASA POWER uses -999 as its fill value. We replicate that sentinel here so
     # the cache stores data in the same format as the raw API response.
     # NOTE: any genuine measurement of exactly -999 will be treated as missing on
     # read-back (_response_to_dataframe); this is an accepted trade-off for safe
     # data analysis.
-    df_copy = df_copy.fillna(-999)
-    param_dict = df_copy.to_dict(orient="dict")
+    df_filled = df.fillna(-999)
+    df_filled.index = pd.DatetimeIndex(df.index).strftime(date_format)
+    param_dict = df_filled.to_dict(orient="dict")
     return {"properties": {"parameter": param_dict}}
 
 
@@ -412,7 +466,10 @@ def _fetch_and_parse(
 def _merge_and_deduplicate(
     df_list: list[pd.DataFrame],
 ) -> pd.DataFrame:
-    """Concatenate, deduplicate, and sort a list of DataFrames by index."""
+    """Concatenate, deduplicate, and sort a list of DataFrames by index.
+
+    On index collisions the row from the earliest DataFrame in *df_list* wins.
+    """
     if not df_list:
         return pd.DataFrame()
 
@@ -425,6 +482,21 @@ def _merge_and_deduplicate(
             df_work = df_work.set_index("date")
         processed_dfs.append(df_work)
 
+    # Fast path: the cached span and the fetched gap edges normally do not
+    # overlap, so concatenating them in start-date order already yields a
+    # sorted, duplicate-free index and the mask + sort passes can be skipped.
+    if all(
+        not d.empty and d.index.is_monotonic_increasing for d in processed_dfs
+    ):
+        ordered = sorted(processed_dfs, key=lambda d: d.index[0])
+        combined_df = pd.concat(ordered)
+        if combined_df.index.is_monotonic_increasing and combined_df.index.is_unique:
+            # Keep the column order the slow path would produce (first frame first).
+            columns = list(dict.fromkeys(c for d in processed_dfs for c in d.columns))
+            if list(combined_df.columns) != columns:
+                combined_df = combined_df[columns]
+            return combined_df
+
     combined_df = pd.concat(processed_dfs)
     final_df = combined_df[~combined_df.index.duplicated(keep="first")]
     return final_df.sort_index()
@@ -433,10 +505,20 @@ def _merge_and_deduplicate(
 def _filter_df_by_date(
     df: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp
 ) -> pd.DataFrame:
-    """Return *df* filtered to the inclusive date range [*start*, *end*]."""
+    """Return *df* filtered to the inclusive date range [*start*, *end*].
+
+    Frames on the request path are date-sorted, so the bounds are located
+    with two binary searches and sliced positionally; this skips the label
+    indexer ``.loc`` builds on every call. Unsorted frames fall back to ``.loc``.
+    """
     if df.empty:
         return df
-    return df.loc[start:end]
+    index = df.index
+    if not (isinstance(index, pd.DatetimeIndex) and index.is_monotonic_increasing):
+        return df.loc[start:end]
+    lo = index.searchsorted(start, side="left")
+    hi = index.searchsorted(end, side="right")
+    return df.iloc[lo:hi]
 
 
 # --- Parsing Helpers ---
@@ -445,7 +527,7 @@ def _filter_df_by_date(
 def _parse_json_response(resp: requests.Response) -> dict[str, Any]:
     """Parse and return the JSON body of *resp*, raising ``ValueError`` on failure."""
     try:
-        return dict(resp.json())
+        return dict(_loads_json(resp.content))
     except json.JSONDecodeError as e:
         raise ValueError(
             f"API request failed (Status {resp.status_code}). "
@@ -453,6 +535,21 @@ def _parse_json_response(resp: requests.Response) -> dict[str, Any]:
         ) from e
 
 
+def _parse_payload_date(
+    d_str: str, temporal_api: str, is_end: bool = False
+) -> pd.Timestamp:
+    """Parse a payload date string (``YYYYMMDD`` or ``YYYYMMDDHH``) to a Timestamp.
+
+    A day-granular *is_end* bound on the hourly endpoint is extended to 23:00 so
+    that it covers the whole final day.
+    """
+    fmt = "%Y%m%d%H" if len(str(d_str)) == 10 else "%Y%m%d"
+    ts = pd.to_datetime(str(d_str), format=fmt)
+    if is_end and fmt == "%Y%m%d" and temporal_api == "hourly":
+        ts = ts + pd.Timedelta(hours=23)
+    return ts
+
+
 def _response_to_dataframe(
     data: dict[str, Any], temporal_api: Literal["daily", "hourly"]
 ) -> pd.DataFrame:
@@ -513,22 +610,29 @@ def _response_to_dataframe(
         return pd.DataFrame()
 
     df = df.reset_index(drop=True).set_index("date")
-    # Replace NASA POWER's -999 fill value with pd.NA for safe downstream analysis.
-    # See also: _convert_df_to_cacheable_json where NaN→-999 round-trip is applied.
-    df = df.replace(-999, pd.NA)
-
+    # JSON numbers already arrive as numeric columns; only coerce the rare
+    # column that does not (e.g. string values), instead of every column.
     for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+        if not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    # Replace NASA POWER's -999 fill value with NA for safe downstream analysis,
+    # as a single frame-wide mask rather than an object-dtype replace.
+    # See also: _convert_df_to_cacheable_json where NaN→-999 round-trip is applied.
+    df = df.where(df != -999)
 
     return df.sort_index()
 
 
 def _ensure_all_params_in_df(df: pd.DataFrame, params: list[str]) -> pd.DataFrame:
-    """Add any missing *params* columns to *df*, filled with ``pd.NA``."""
-    for param in params:
-        if param not in df.columns:
-            df[param] = pd.NA
-    return df[params]
+    """Return *df* with exactly the *params* columns, adding any missing ones as NaN.
+
+    A single ``reindex`` replaces inserting missing columns one at a time, and
+    returns a new frame, so callers mutating the result never write through to
+    *df* (possibly a cached frame). Added columns are ``float64`` NaN, matching
+    the all-missing frames built elsewhere.
+    """
+    return df.reindex(columns=params)
 
 
 def _regional_response_to_dataframe(data: dict[str, Any]) -> pd.DataFrame:
@@ -536,9 +640,10 @@ def _regional_response_to_dataframe(data: dict[str, Any]) -> pd.DataFrame:
 
     Iterates over ``features``, extracting the ``geometry.coordinates``
     (longitude, latitude, optional elevation) and the
-    ``properties.parameter`` time-series for each grid cell. Assembles a
-    long-form record list with columns ``date``, ``lat``, ``lon``,
-    optionally ``elevation``, and one column per parameter.
+    ``properties.parameter`` time-series for each grid cell. Each cell is
+    pivoted into a date-indexed frame with ``lat``, ``lon``, optionally
+    ``elevation``, and one column per parameter, and the cells are stacked
+    into a single long-form frame.
 
     Args:
         data: Parsed GeoJSON response dict. Expected structure::
@@ -557,7 +662,7 @@ def _regional_response_to_dataframe(data: dict[str, Any]) -> pd.DataFrame:
     if not features:
         return pd.DataFrame()
 
-    records: list[dict[str, Any]] = []
+    frames: list[pd.DataFrame] = []
     for feature in features:
         coords = feature.get("geometry", {}).get("coordinates", [])
         if len(coords) < 2:
@@ -566,33 +671,29 @@ def _regional_response_to_dataframe(data: dict[str, Any]) -> pd.DataFrame:
         elevation = coords[2] if len(coords) > 2 else None
 
         params_data = feature.get("properties", {}).get("parameter", {})
-        # Build a dict of {date_str: {param: value, ...}} across all params
-        date_map: dict[str, dict[str, Any]] = {}
-        for param_name, time_series in params_data.items():
-            for date_str, value in time_series.items():
-                if date_str not in date_map:
-                    date_map[date_str] = {}
-                date_map[date_str][param_name] = value if value != -999 else pd.NA
-
-        for date_str, param_values in date_map.items():
-            record: dict[str, Any] = {
-                # Regional endpoint only supports daily resolution; hourly regional
-                # is not available via the NASA POWER API (hardcoded daily format).
-                "date": pd.to_datetime(date_str, format="%Y%m%d"),
-                "lat": lat,
-                "lon": lon,
-            }
-            if elevation is not None:
-                record["elevation"] = elevation
-            record.update(param_values)
-            records.append(record)
-
-    if not records:
+        # pandas pivots {param: {date_str: value}} into a date-indexed frame in
+        # one constructor call, instead of reshaping per (param, date) pair.
+        cell_df = pd.DataFrame(params_data)
+        if cell_df.empty:
+            continue
+
+        # Regional endpoint only supports daily resolution; hourly regional
+        # is not available via the NASA POWER API (hardcoded daily format).
+        cell_df.index = pd.to_datetime(cell_df.index, format="%Y%m%d")
+        cell_df.index.name = "date"
+        cell_df = cell_df.replace(-999, pd.NA)
+
+        metadata: dict[str, Any] = {"lat": lat, "lon": lon}
+        if elevation is not None:
+            metadata["elevation"] = elevation
+        for pos, (col, val) in enumerate(metadata.items()):
+            cell_df.insert(pos, col, val)
+        frames.append(cell_df)
+
+    if not frames:
         return pd.DataFrame()
 
-    df = pd.DataFrame(records)
-    df = df.set_index("date").sort_index()
-    return df
+    return pd.concat(frames).sort_index()
 
 
 class PowerQuery(BaseModel):
@@ -690,23 +791,38 @@ class PowerClient:
             ``None`` if caching is disabled or failed to initialise.
         cache_cfg: Effective cache configuration dict from
             :func:`~aidweather.config._Config.cache_config`.
+        memory_entries_limit: Maximum number of decoded cache entries kept in
+            memory (``cache_config.memory_entries``); ``0`` disables the
+            in-memory layer.
         api_limits: API limits dict from
             :func:`~aidweather.config._Config.api_limits`.
         rate_limiter: Active :class:`RateLimiter` instance.
+        connection_slots: Semaphore bounding concurrent point requests to
+            ``api_limits.max_workers``.
     """
 
     def __init__(
         self,
         temporal_api: Literal["daily", "hourly"] = "daily",
         session: requests.Session | None = None,
+        cache_dir: str | Path | None = None,
     ):
         """Initialise the client, configure caching, rate limiter, and HTTP session.
 
         Args:
             temporal_api: Temporal resolution for all API calls made by this
                 instance. Must be ``"daily"`` or ``"hourly"``.
-            session: Optional pre-configured :class:`requests.Session`. A
-                retry-enabled session is created automatically if omitted.
+            session: Optional pre-configured :class:`requests.Session`. If
+                omitted, a process-wide retry-enabled session is shared with
+                all other clients created without one, so their connection
+                pools (and open keep-alive connections) are reused. Pass a
+                dedicated session if you need to customise headers or adapters
+                for this client alone.
+            cache_dir: Optional directory for this client's SQLite cache
+                database. Overrides ``AIDWEATHER_CACHE_DIR`` and the
+                configured ``cache_config.path``, and enables caching even
+                if it is disabled in the configuration. Useful for giving a
+                notebook or CI job its own persistent, reproducible cache.
 
         Raises:
             ValueError: If *temporal_api* is not ``"daily"`` or ``"hourly"``.
@@ -718,9 +834,27 @@ class PowerClient:
         self.base_url = cfg.get_url(temporal_api, endpoint_type="point")
         self.regional_base_url = cfg.get_url(temporal_api, endpoint_type="regional")
         self.params_desc = cfg.params(group="all")
-        self.session = session or _session_with_retries()
+        # Read once here, like api_limits/cache_config, so per-request
+        # validation does not rebuild the catalogue from cfg on every call.
+        self._known_params = frozenset(self.params_desc)
+        # Catalogued codes the hourly endpoint does not serve. The authoritative
+        # signal is availability.hourly_start being unset; units.hourly is set to
+        # null in lockstep purely for display and must not be relied on here.
+        self._daily_only_params: frozenset[str] = frozenset()
+        if temporal_api == "hourly":
+            param_meta = cfg.param_metadata()
+            self._daily_only_params = frozenset(
+                p
+                for p in self._known_params
+                if param_meta.get(p, {}).get("availability", {}).get("hourly_start") is None
+            )
+        self.session = session or _get_default_session()
         self.db_conn: sqlite3.Connection | None = None
         self.db_lock = threading.Lock()
+        # Decoded cache entries keyed by cache key (LRU, bounded by
+        # cache_config.memory_entries), so repeated requests for an already
+        # covered window skip the SQLite read, gunzip, and JSON→DataFrame parse.
+        self._frame_cache: OrderedDict[str, pd.DataFrame] = OrderedDict()
         self._metrics: dict[str, Any] = {
             "total_requests": 0,
             "api_calls": 0,
@@ -733,12 +867,25 @@ class PowerClient:
 
         # Caching setup
         self.cache_cfg = cfg.cache_config()
+        if cache_dir is not None:
+            self.cache_cfg["path"] = str(Path(cache_dir).expanduser())
+            self.cache_cfg["enabled"] = True
+        # Each entry holds a location's whole cached history, so the count is
+        # configurable and 0 turns the in-memory layer off.
+        self.memory_entries_limit = max(
+            0, int(self.cache_cfg.get("memory_entries", 32))
+        )
         if self.cache_cfg.get("enabled", False):
             self._init_cache_db()
 
         # API Limits & Concurrency Setup
         self.api_limits = cfg.api_limits()
         self.max_workers_limit = self.api_limits.get("max_workers", 5)
+        # Caps in-flight point requests across all threads using this client,
+        # including gap fetches nested inside multi-point worker threads.
+        self.connection_slots = threading.BoundedSemaphore(
+            max(1, self.max_workers_limit)
+        )
 
         # Rate Limiter Setup
         rate_limit_calls = self.api_limits.get("rate_limit_calls", 30)
@@ -783,7 +930,8 @@ class PowerClient:
         """Validate *params* and the date range; emit warnings for unknown parameter codes.
 
         Checks that all codes in *params* are in the ``"all"`` parameter group
-        and that *start* does not exceed *end*. Unknown codes produce a
+        (as read from the configuration when the client was constructed) and
+        that *start* does not exceed *end*. Unknown codes produce a
         :class:`UserWarning` rather than raising, so that users can still
         query experimental or less-documented parameters.
 
@@ -803,8 +951,7 @@ class PowerClient:
                 catalogue.
         """
         # Validate parameters
-        known_params = set(cfg.params("all").keys())
-        unknown = [p for p in params if p not in known_params]
+        unknown = [p for p in params if p not in self._known_params]
         if unknown:
             warnings.warn(
                 f"Unknown parameter(s): {', '.join(unknown)}. These might not be supported by NASA POWER.",
@@ -812,21 +959,13 @@ class PowerClient:
                 stacklevel=3,
             )
 
-        # Reject daily-only parameters when the active endpoint is hourly. The
-        # authoritative signal is availability.hourly_start being unset; units.hourly
-        # is set to null in lockstep purely for display and must not be relied on here.
-        if self.temporal_api == "hourly":
-            daily_only = [
-                p
-                for p in params
-                if p in known_params
-                and cfg.param_metadata(p).get("availability", {}).get("hourly_start") is None
-            ]
-            if daily_only:
-                raise ValueError(
-                    f"Parameter(s) {', '.join(daily_only)} are not available on the NASA "
-                    f"POWER hourly endpoint (daily-only). Use temporal_api='daily' instead."
-                )
+        # Empty for daily clients, so daily-only codes are only rejected on hourly.
+        daily_only = [p for p in params if p in self._daily_only_params]
+        if daily_only:
+            raise ValueError(
+                f"Parameter(s) {', '.join(daily_only)} are not available on the NASA "
+                f"POWER hourly endpoint (daily-only). Use temporal_api='daily' instead."
+            )
 
         # Validate date range
         start_dt = parse_date_strict(start)
@@ -834,8 +973,30 @@ class PowerClient:
         if start_dt > end_dt:
             raise ValueError("start date must be before or equal to end date")
 
+    def _get_memoized_frame(self, key: str) -> pd.DataFrame | None:
+        """Return the in-memory decoded frame for *key*, marking it recently used."""
+        with self.db_lock:
+            memo = self._frame_cache.get(key)
+            if memo is not None:
+                self._frame_cache.move_to_end(key)
+            return memo
+
+    def _memoize_frame(self, key: str, df: pd.DataFrame) -> None:
+        """Store *df* as the decoded frame for *key*, evicting the oldest entries."""
+        if not self.memory_entries_limit:
+            return
+        with self.db_lock:
+            self._frame_cache[key] = df
+            self._frame_cache.move_to_end(key)
+            while len(self._frame_cache) > self.memory_entries_limit:
+                self._frame_cache.popitem(last=False)
+
     def _read_from_cache_db(self, key: str) -> pd.DataFrame | None:
-        """Load and decompress a cached DataFrame for *key*, or return ``None`` if missing."""
+        """Load and decompress a cached DataFrame for *key*, or return ``None`` if missing.
+
+        Always reads SQLite, since other clients sharing the database may have
+        extended the entry; the decoded frame is then memoized for this instance.
+        """
         if not self.db_conn:
             return None
 
@@ -856,12 +1017,13 @@ class PowerClient:
             _, compressed_data = row
             try:
                 self._metrics["cache_initial_bytes"] = len(compressed_data)
-                raw_data = json.loads(gzip.decompress(compressed_data))
+                raw_data = _loads_json(gzip.decompress(compressed_data))
                 cached_df = _response_to_dataframe(raw_data, self.temporal_api)
 
                 if cached_df.empty:
                     return None
 
+                self._memoize_frame(key, cached_df)
                 return cached_df
             except (json.JSONDecodeError, gzip.BadGzipFile) as e:
                 logger.warning(
@@ -889,8 +1051,23 @@ class PowerClient:
             except (sqlite3.Error, TypeError) as e:
                 logger.warning("Could not write to cache for key %s: %s", key, e)
 
+    def clear_memory_cache(self) -> None:
+        """Drop all decoded cache entries held in memory by this instance.
+
+        The on-disk SQLite cache is left untouched; the next request for each
+        key re-reads and re-decodes it from the database. Use this after the
+        database has been modified externally (e.g. ``aidweather cache clear``
+        from another process).
+        """
+        with self.db_lock:
+            self._frame_cache.clear()
+
     def _format_date(self, date_str: Any) -> str:
         """Format *date_str* into the ``YYYYMMDD`` string required by the API."""
+        # Already-parsed values (Timestamps included) skip the pd.to_datetime
+        # round-trip; callers on the hot path pass Timestamps parsed once.
+        if isinstance(date_str, datetime):
+            return date_str.strftime("%Y%m%d")
         dt = parse_date_strict(date_str).to_pydatetime()
         return dt.strftime("%Y%m%d")
 
@@ -1024,13 +1201,27 @@ class PowerClient:
         }
         return payload
 
+    def _fetch_payload(
+        self, url: str, payload: dict[str, Any]
+    ) -> tuple[pd.DataFrame, int]:
+        """Issue one rate-limited, concurrency-capped point request and parse it."""
+        self.rate_limiter.acquire()
+        with self.connection_slots:
+            return _fetch_and_parse(self.session, url, payload, self.temporal_api)
+
     def _fetch_and_parse_ranges(
         self,
         ranges: list[tuple[pd.Timestamp, pd.Timestamp]],
         base_payload: dict[str, Any],
         url: str,
     ) -> list[pd.DataFrame]:
-        """Fetch each date range in *ranges* against *base_payload* and return a list of DataFrames."""
+        """Fetch each date range in *ranges* against *base_payload* and return a list of DataFrames.
+
+        When the cache is missing both a leading and a trailing edge, the
+        ranges are fetched concurrently; :attr:`connection_slots` keeps the
+        total number of in-flight requests within the configured limit even
+        when this runs inside a multi-point worker thread.
+        """
         newly_fetched_dfs: list[pd.DataFrame] = []
         if not ranges:
             return newly_fetched_dfs
@@ -1039,12 +1230,26 @@ class PowerClient:
         start_time = time.perf_counter()
         logger.info("Fetching %d missing date range(s).", len(ranges))
 
+        payloads = []
         for start, end in ranges:
             payload = base_payload.copy()
             payload["start"] = self._format_date(start)
             payload["end"] = self._format_date(end)
-            self.rate_limiter.acquire()
-            df, b = _fetch_and_parse(self.session, url, payload, self.temporal_api)
+            payloads.append(payload)
+
+        if len(payloads) == 1:
+            results = [self._fetch_payload(url, payloads[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(payloads), self.max_workers_limit)
+            ) as executor:
+                results = list(
+                    executor.map(lambda p: self._fetch_payload(url, p), payloads)
+                )
+
+        # Metrics are updated here, on the calling thread, so workers never
+        # race on the shared counters.
+        for df, b in results:
             self._metrics["api_calls"] += 1
             if not df.empty:
                 newly_fetched_dfs.append(df)
@@ -1090,10 +1295,7 @@ class PowerClient:
 
         if not use_cache:
             start_time = time.perf_counter()
-            self.rate_limiter.acquire()
-            df, b = _fetch_and_parse(
-                self.session, fetch_url, base_payload, self.temporal_api
-            )
+            df, b = self._fetch_payload(fetch_url, base_payload)
             self._metrics["api_calls"] += 1
             self._metrics["total_downloaded_bytes"] += b
             self._metrics["fetch_duration"] = time.perf_counter() - start_time
@@ -1101,16 +1303,22 @@ class PowerClient:
 
         cache_key = _make_cache_key(base_payload, self.temporal_api)
 
-        def _parse_payload_date(d_str: str, is_end: bool = False) -> pd.Timestamp:
-            """Parses a payload date string (YYYYMMDD or YYYYMMDDHH) to a Timestamp."""
-            fmt = "%Y%m%d%H" if len(str(d_str)) == 10 else "%Y%m%d"
-            ts = pd.to_datetime(str(d_str), format=fmt)
-            if is_end and fmt == "%Y%m%d" and self.temporal_api == "hourly":
-                ts = ts + pd.Timedelta(hours=23)
-            return ts
+        req_start = _parse_payload_date(base_payload["start"], self.temporal_api)
+        req_end = _parse_payload_date(
+            base_payload["end"], self.temporal_api, is_end=True
+        )
 
-        req_start = _parse_payload_date(base_payload["start"], is_end=False)
-        req_end = _parse_payload_date(base_payload["end"], is_end=True)
+        # The in-memory frame is only trusted when it already covers the whole
+        # window. Otherwise re-read SQLite: another client sharing the database
+        # may hold a wider range, and merging into this instance's older copy
+        # would overwrite it with less data.
+        memo = self._get_memoized_frame(cache_key)
+        if memo is not None and not _get_date_ranges_to_fetch(
+            req_start, req_end, memo, self.temporal_api
+        ):
+            logger.info("Retrieved full date range from memory for key %s.", cache_key)
+            self._metrics["cache_hits"] += 1
+            return _filter_df_by_date(memo, req_start, req_end)
 
         cached_df = self._read_from_cache_db(cache_key)
 
@@ -1155,6 +1363,7 @@ class PowerClient:
                 combined_df, self.temporal_api
             )
             self._write_to_cache_db(cache_key, cacheable_json)
+            self._memoize_frame(cache_key, combined_df)
 
         if combined_df.empty:
             logger.warning("Fetching and merging resulted in an empty DataFrame.")
@@ -1194,8 +1403,9 @@ class PowerClient:
         Returns:
             A :class:`~pandas.DataFrame` with a :class:`~pandas.DatetimeIndex`
             named ``"date"`` and one numeric column per requested parameter.
-            Missing values are :data:`pandas.NA`. Returns a NaN-filled frame
-            with the correct index if the API returned no data.
+            Fill values and parameters absent from the response are ``NaN``
+            (missing columns are ``float64``). Returns a NaN-filled frame with
+            the correct index if the API returned no data.
         """
         if request is None:
             request = PointRequest(**kwargs)
@@ -1245,9 +1455,10 @@ class PowerClient:
 
         Returns:
             A :class:`~pandas.DataFrame` indexed by ``"date"`` with one
-            numeric column per parameter. Missing values are
-            :data:`pandas.NA`. Returns a NaN-filled frame with the correct
-            index if the API returned no data.
+            numeric column per parameter. Fill values and parameters absent
+            from the response are ``NaN`` (missing columns are ``float64``).
+            Returns a NaN-filled frame with the correct index if the API
+            returned no data.
 
         Raises:
             ValueError: If *params* is empty or exceeds API limits.
@@ -1258,11 +1469,16 @@ class PowerClient:
         if not params:
             raise ValueError("No parameters provided")
 
+        # Parse the bounds once and reuse the Timestamps for the payload, the
+        # empty-result index, and the final filter.
+        req_start = parse_date_strict(start)
+        req_end = parse_date_strict(end)
+
         lat, lon = coord.as_decimal()
         payload = self._build_point_payload(
             params=params,
-            start=start,
-            end=end,
+            start=req_start,
+            end=req_end,
             lon=lon,
             lat=lat,
             elevation=elevation,
@@ -1271,8 +1487,6 @@ class PowerClient:
         )
         df = self._fetch_data(payload)
         if df.empty:
-            req_start = parse_date_strict(start)
-            req_end = parse_date_strict(end)
             date_range = pd.date_range(
                 start=req_start,
                 end=req_end,
@@ -1281,10 +1495,10 @@ class PowerClient:
             )
             return pd.DataFrame(np.nan, index=date_range, columns=params)
 
-        df = _ensure_all_params_in_df(df, params)
-        req_start = parse_date_strict(start)
-        req_end = parse_date_strict(end)
-        return _filter_df_by_date(df, req_start, req_end)
+        # Slice to the requested window before aligning columns, so the reindex
+        # copies only the returned rows rather than the whole cached range.
+        df = _filter_df_by_date(df, req_start, req_end)
+        return _ensure_all_params_in_df(df, params)
 
     # ------------------------------------------------------------------
     # get_multi_point_data helpers
@@ -1385,21 +1599,22 @@ class PowerClient:
                 df = future.result()
                 if df.empty:
                     continue
-                df = df.reset_index()
+                metadata: dict[str, Any] = {}
                 if isinstance(point, dict):
-                    df["lat"] = point["lat"]
-                    df["lon"] = point["lon"]
+                    metadata["lat"] = point["lat"]
+                    metadata["lon"] = point["lon"]
                     if point.get("name") is not None:
-                        df["name"] = point["name"]
+                        metadata["name"] = point["name"]
                     if point.get("elevation") is not None:
-                        df["elevation"] = point["elevation"]
+                        metadata["elevation"] = point["elevation"]
                 else:
-                    df["lat"] = point[0]
-                    df["lon"] = point[1]
+                    metadata["lat"] = point[0]
+                    metadata["lon"] = point[1]
                     if len(point) > 2:
-                        df["elevation"] = point[2]
-                df = df.set_index("date")
-                all_results.append(df)
+                        metadata["elevation"] = point[2]
+                # One assign on the date-indexed frame, rather than a
+                # reset_index/set_index round-trip that copies it twice.
+                all_results.append(df.assign(**metadata))
             except Exception as e:
                 logger.warning("Failed to fetch data for point %s: %s", point, e)
                 failed_points.append((point, str(e)))
@@ -1465,6 +1680,11 @@ class PowerClient:
 
         parsed_points = self._parse_points_input(points)
 
+        # Every point shares the same bounds; parse them here once instead of
+        # in each worker.
+        start = parse_date_strict(start)
+        end = parse_date_strict(end)
+
         limit = getattr(self, "max_workers_limit", 5)
         if max_workers > limit:
             logger.warning(
@@ -1495,6 +1715,8 @@ class PowerClient:
 
     def _build_profile_table(self, df: pd.DataFrame) -> Table:
         """Builds the Weather Data Profile Rich table."""
+        from rich.table import Table
+
         table = Table(
             title="Weather Data Profile", show_header=True, header_style="bold cyan"
         )
@@ -1511,6 +1733,8 @@ class PowerClient:
 
     def _build_perf_table(self) -> Table:
         """Builds the Transfer & Cache Performance Rich table."""
+        from rich.table import Table
+
         m = self._metrics
         table = Table(
             title="Transfer & Cache Performance",
@@ -1535,6 +1759,8 @@ class PowerClient:
 
     def _build_stats_table(self) -> Table:
         """Builds the Request Statistics Rich table."""
+        from rich.table import Table
+
         m = self._metrics
         table = Table(
             title="Request Statistics",
@@ -1556,6 +1782,8 @@ class PowerClient:
 
     def _build_conn_table(self) -> Table:
         """Builds the NASA POWER Connection Info Rich table."""
+        from rich.table import Table
+
         table = Table(
             title="NASA POWER Connection Info",
             show_header=True,
@@ -1568,7 +1796,7 @@ class PowerClient:
         table.add_row("Base URL", self.base_url.split("/temporal")[0])
         return table
 
-    def summarize(self, df: pd.DataFrame) -> None:
+    def summarize(self, df: pd.DataFrame, console: Console | None = None) -> None:
         """Print a Rich summary panel with data profile, transfer metrics, and request statistics.
 
         Renders four :class:`~rich.panel.Panel` blocks to the console:
@@ -1584,8 +1812,16 @@ class PowerClient:
         Args:
             df: The result DataFrame returned by any ``get_*_data`` method.
                 Used to populate the data profile section.
+            console: Optional :class:`~rich.console.Console` to render to.
+                Pass one in when summarizing repeatedly (e.g. in a loop) to
+                reuse it instead of constructing a new console per call.
         """
-        console = Console()
+        from rich.panel import Panel
+
+        if console is None:
+            from rich.console import Console
+
+            console = Console()
         console.print(Panel(self._build_profile_table(df), subtitle="Data Insight"))
         console.print(Panel(self._build_perf_table(), subtitle="Performance"))
         console.print(Panel(self._build_stats_table(), subtitle="Efficiency"))
@@ -1796,13 +2032,14 @@ class PowerClient:
             ValueError: If neither *num_points* nor *spacing_km* is provided,
                 or if *spacing_km* is not positive.
         """
-        # Great-circle distance approximation between the two endpoints
+        # Great-circle distance approximation between the two endpoints. These
+        # are plain scalars, so math avoids numpy's ufunc dispatch and boxing.
         lat1, lon1 = start_coord.as_decimal()
         lat2, lon2 = end_coord.as_decimal()
         dlat_km = (lat2 - lat1) * 111.1
-        mid_lat_rad = np.deg2rad((lat1 + lat2) / 2)
-        dlon_km = (lon2 - lon1) * 111.32 * np.cos(mid_lat_rad)
-        total_km = float(np.hypot(dlat_km, dlon_km))
+        mid_lat_rad = math.radians((lat1 + lat2) / 2)
+        dlon_km = (lon2 - lon1) * 111.32 * math.cos(mid_lat_rad)
+        total_km = math.hypot(dlat_km, dlon_km)
 
         # Minimum spacing derived from requested parameter native grid (latitude step)
         min_lat_deg = 0.5
@@ -1906,8 +2143,10 @@ class PowerClient:
 
         lat1, lon1 = request.start_coord.as_decimal()
         lat2, lon2 = request.end_coord.as_decimal()
-        lats = np.linspace(lat1, lat2, n)
-        lons = np.linspace(lon1, lon2, n)
+        # Round the whole arrays once and hand plain floats to the per-point
+        # dicts, rather than rounding numpy scalars one element at a time.
+        lats = np.round(np.linspace(lat1, lat2, n), 4).tolist()
+        lons = np.round(np.linspace(lon1, lon2, n), 4).tolist()
 
         max_workers = request.max_workers
         limit = getattr(self, "max_workers_limit", 5)
@@ -1929,7 +2168,7 @@ class PowerClient:
         )
 
         points_with_metadata: list[dict[str, Any]] = [
-            {"lat": round(p_lat, 4), "lon": round(p_lon, 4), "name": f"Point_{i + 1}"}
+            {"lat": p_lat, "lon": p_lon, "name": f"Point_{i + 1}"}
             for i, (p_lat, p_lon) in enumerate(zip(lats, lons, strict=True))
         ]
 
@@ -222,7 +222,7 @@ class _Config:
         3. The XDG user cache directory (``platformdirs.user_cache_dir``).
 
         All other keys from the ``cache_config`` section of ``config.json``
-        (e.g. ``enabled``) are merged over the defaults. The ``path`` key in
+        (e.g. ``enabled``, ``memory_entries``) are merged over the defaults. The ``path`` key in
         the returned dict always reflects the resolved effective path.
 
         Returns:
@@ -244,6 +244,7 @@ class _Config:
         defaults: dict[str, Any] = {
             "enabled": True,
             "path": effective_path,
+            "memory_entries": 32,
         }
         json_section = self.get("cache_config")
         if not isinstance(json_section, dict):
@@ -120,6 +120,28 @@ def test_mixed_param_latency_returns_partial_data(mock_session):
     assert len(df) == 1
     assert df.loc["2025-11-18", "T2M"] == 15.0
     assert pd.isna(df.loc["2025-11-18", "ALLSKY_SFC_SW_DWN"])
+    assert list(df.columns) == ["T2M", "ALLSKY_SFC_SW_DWN"]
+    assert df["ALLSKY_SFC_SW_DWN"].dtype == "float64"
+
+
+def test_response_to_dataframe_masks_string_fill_values():
+    """String-valued columns are coerced to numbers before -999 is masked."""
+    from aidweather.client import _response_to_dataframe
+
+    data = {
+        "properties": {
+            "parameter": {
+                "T2M": {"20230101": "-999", "20230102": "5"},
+                "RH2M": {"20230101": 80.5, "20230102": -999},
+            }
+        }
+    }
+    df = _response_to_dataframe(data, "daily")
+
+    assert df["T2M"].dtype == "float64"
+    assert df["T2M"].isna().tolist() == [True, False]
+    assert df.loc["2023-01-02", "T2M"] == 5.0
+    assert df["RH2M"].isna().tolist() == [False, True]
 
 
 def test_all_weather_params_available_after_lag(mock_session):
@@ -166,3 +188,57 @@ def test_all_solar_params_unavailable_before_lag(mock_session):
     assert not df.empty
     assert df.isnull().values.all()
     assert list(df.columns) == solar_params
+
+
+def test_clients_share_default_session():
+    """Clients built without a session reuse one pooled session; explicit ones are kept."""
+    import requests
+
+    a = PowerClient(temporal_api="daily")
+    b = PowerClient(temporal_api="hourly")
+    assert a.session is b.session
+    assert a.session.adapters["https://"].max_retries.total == 5
+
+    own = requests.Session()
+    assert PowerClient(session=own).session is own
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_json_with_and_without_orjson(monkeypatch, use_orjson):
+    """JSON decoding works with the optional orjson parser and with the stdlib fallback."""
+    import json
+    import math
+
+    import aidweather.client as client_mod
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(client_mod, "orjson", None)
+
+    assert client_mod._loads_json(b'{"a": {"20230101": -999}}') == {"a": {"20230101": -999}}
+    # Non-standard tokens written by json.dumps must still round-trip.
+    assert math.isnan(client_mod._loads_json(b'{"a": NaN}')["a"])
+    with pytest.raises(json.JSONDecodeError):
+        client_mod._loads_json(b"not json")
+
+
+def test_import_does_not_load_rich():
+    """rich is only needed for summarize(), so importing the package must not pull it in."""
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    # pytest's pythonpath setting does not reach child processes, so point the
+    # subprocess at src/ explicitly rather than relying on an installed package.
+    src_dir = Path(__file__).resolve().parents[1] / "src"
+    code = "import sys, aidweather; print('rich' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": str(src_dir)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
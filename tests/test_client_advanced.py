@@ -107,6 +107,31 @@ def test_get_multi_point_data_success(mock_session):
     assert df["lat"].nunique() == 2
 
 
+def test_multi_point_metadata_columns(mock_session):
+    """Point metadata is appended after the parameter columns, with dates as a column."""
+    mock_session.get(
+        "https://power.larc.nasa.gov/api/temporal/daily/point",
+        json=SAMPLE_POINT_RESPONSE,
+    )
+    client = PowerClient()
+    client.cache_cfg["enabled"] = False
+
+    df, failed = client.get_multi_point_data(
+        points=[{"lat": 10.0, "lon": 20.0, "name": "A", "elevation": 5.0}, (1.0, 2.0, 3.0)],
+        start="2023-01-01",
+        end="2023-01-02",
+        params=["T2M", "RH2M"],
+    )
+
+    assert not failed
+    assert list(df.columns[:5]) == ["date", "T2M", "RH2M", "lat", "lon"]
+    # name/elevation order follows whichever point finished first.
+    assert set(df.columns[5:]) == {"name", "elevation"}
+    named = df[df["name"] == "A"]
+    assert named["elevation"].tolist() == [5.0, 5.0]
+    assert df.loc[df["lat"] == 1.0, "elevation"].tolist() == [3.0, 3.0]
+
+
 def test_collect_futures_results_reports_failure_reason():
     """Failed points must carry the actual error, not just the point identity, so
     callers (and the CLI) can tell a real failure apart from "no data available"."""
@@ -167,6 +192,36 @@ def test_get_regional_data_success(mock_session):
     assert mock_session.last_request.qs["longitude-max"] == ["11.0"]
 
 
+def test_regional_response_to_dataframe_fill_values_and_bad_cells():
+    """Fill values become NA and cells without coordinates or data are skipped."""
+    from aidweather.client import _regional_response_to_dataframe
+
+    data = {
+        "features": [
+            {
+                "geometry": {"coordinates": [10.0, 20.0, 50.5]},
+                "properties": {"parameter": {"T2M": {"20230101": 14.5, "20230102": -999}}},
+            },
+            {
+                "geometry": {"coordinates": [10.5]},
+                "properties": {"parameter": {"T2M": {"20230101": 1.0}}},
+            },
+            {
+                "geometry": {"coordinates": [11.0, 20.0]},
+                "properties": {"parameter": {}},
+            },
+        ]
+    }
+
+    df = _regional_response_to_dataframe(data)
+
+    assert list(df.columns) == ["lat", "lon", "elevation", "T2M"]
+    assert list(df.index) == [pd.Timestamp("2023-01-01"), pd.Timestamp("2023-01-02")]
+    assert df["T2M"].iloc[0] == 14.5
+    assert pd.isna(df["T2M"].iloc[1])
+    assert (df["lat"] == 20.0).all() and (df["lon"] == 10.0).all()
+
+
 def test_get_regional_data_from_coordinates_success(mock_session):
     """Verify regional bounding box queries with GeoCoordinate convenience wrapper."""
     mock_session.get(
@@ -222,6 +277,7 @@ def test_get_transect_data_success(mock_session):
     assert "lon" in df.columns
     # 3 unique locations along the latitude axis
     assert df["lat"].nunique() == 3
+    assert sorted(df["lat"].unique()) == [15.0, 17.5, 20.0]
 
 
 def test_get_transect_data_from_coordinates_success(mock_session):
@@ -309,6 +365,25 @@ def test_summarize_console_logging(capsys):
     assert "API Connection" in captured.out
 
 
+def test_summarize_reuses_supplied_console(capsys):
+    """A caller-supplied console receives every panel and nothing goes to stdout."""
+    import io
+
+    from rich.console import Console
+
+    client = PowerClient()
+    console = Console(file=io.StringIO(), record=True, width=120)
+    dummy_df = pd.DataFrame({"T2M": [15.0]}, index=pd.to_datetime(["2023-01-01"]))
+
+    client.summarize(dummy_df, console=console)
+    client.summarize(dummy_df, console=console)
+
+    text = console.export_text()
+    assert text.count("Data Insight") == 2
+    assert "API Connection" in text
+    assert capsys.readouterr().out == ""
+
+
 def test_regional_request_failure_logging(mock_session):
     """Verify that when a regional request fails, it logs using _safe_payload_repr without raising NameError."""
     # Register an error status code to trigger RequestException
@@ -65,14 +65,18 @@ def test_cache_fetches_and_merges_missing_date_ranges(mock_cache_config):
     start_response = {"properties": {"parameter": {"T2M": {"20230101": 25.0}}}}
     end_response = {"properties": {"parameter": {"T2M": {"20230103": 27.0}}}}
 
+    # The two missing edges are fetched concurrently, so route by query string
+    # rather than relying on request order.
+    responses_by_start = {
+        "20230102": cached_response,
+        "20230101": start_response,
+        "20230103": end_response,
+    }
+
     with requests_mock.Mocker() as m:
         m.get(
             requests_mock.ANY,
-            [
-                {"json": cached_response},
-                {"json": start_response},
-                {"json": end_response},
-            ],
+            json=lambda request, context: responses_by_start[request.qs["start"][0]],
         )
 
         client = PowerClient(temporal_api="daily")
@@ -190,6 +194,8 @@ def test_cache_roundtrip_preserves_missing_values(mock_cache_config):
             )
             assert m.call_count == 1
 
+            # Force the second call through the SQLite blob, not the in-memory frame.
+            client.clear_memory_cache()
             cached_df = client.get_point_data(
                 lat=1.0, lon=2.0, start=start, end=end, params=["T2M"]
             )
@@ -266,3 +272,266 @@ def test_concurrent_cache_writes(mock_cache_config):
         assert not df.empty
 
 
+def test_repeat_requests_served_from_memory(mock_cache_config, monkeypatch):
+    """Decoded cache entries are reused in memory until clear_memory_cache() is called."""
+    import aidweather.client as client_mod
+
+    api_response = {"properties": {"parameter": {"T2M": {"20230101": 25.0, "20230102": 26.0}}}}
+    decompress_calls = []
+    real_decompress = client_mod.gzip.decompress
+
+    def counting_decompress(data):
+        decompress_calls.append(1)
+        return real_decompress(data)
+
+    monkeypatch.setattr(client_mod.gzip, "decompress", counting_decompress)
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=api_response)
+        client = PowerClient(temporal_api="daily")
+        kwargs = dict(lat=10.0, lon=20.0, start="20230101", end="20230102", params=["T2M"])
+
+        first = client.get_point_data(**kwargs)
+        second = client.get_point_data(**kwargs)
+        assert m.call_count == 1
+        assert not decompress_calls, "repeat request should not re-read SQLite"
+        pd.testing.assert_frame_equal(first, second)
+
+        client.clear_memory_cache()
+        third = client.get_point_data(**kwargs)
+        assert m.call_count == 1
+        assert len(decompress_calls) == 1
+        pd.testing.assert_frame_equal(first, third)
+
+
+def _daily_response(start, days):
+    dates = pd.date_range(start, periods=days, freq="D").strftime("%Y%m%d")
+    return {"properties": {"parameter": {"T2M": {d: float(i) for i, d in enumerate(dates)}}}}
+
+
+def test_stale_memory_frame_does_not_shrink_shared_cache(mock_cache_config):
+    """A client's in-memory frame must not hide or overwrite a wider range that
+    another client sharing the database has since cached."""
+    kwargs = dict(lat=10.0, lon=20.0, params=["T2M"])
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=_daily_response("2023-01-01", 10))
+        client_b = PowerClient(temporal_api="daily")
+        client_b.get_point_data(start="20230101", end="20230110", **kwargs)
+
+        m.get(requests_mock.ANY, json=_daily_response("2023-01-01", 31))
+        client_a = PowerClient(temporal_api="daily")
+        client_a.get_point_data(start="20230101", end="20230131", **kwargs)
+        assert m.call_count == 2
+
+        # B's memoized Jan 1-10 frame does not cover the window, so it must
+        # re-read A's Jan 1-31 entry instead of fetching and writing back less.
+        df = client_b.get_point_data(start="20230101", end="20230115", **kwargs)
+        assert m.call_count == 2
+        assert len(df) == 15
+
+        fresh = PowerClient(temporal_api="daily")
+        assert len(fresh.get_point_data(start="20230101", end="20230131", **kwargs)) == 31
+        assert m.call_count == 2
+
+
+def test_memory_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    """The in-memory frame cache is bounded by cache_config.memory_entries and
+    evicts the oldest location first."""
+    monkeypatch.setattr(
+        cfg,
+        "cache_config",
+        lambda: {"enabled": True, "path": str(tmp_path), "memory_entries": 2},
+    )
+    client = PowerClient(temporal_api="daily")
+    frame = pd.DataFrame({"T2M": [1.0]}, index=pd.DatetimeIndex(["2023-01-01"], name="date"))
+
+    for key in ("a", "b"):
+        client._memoize_frame(key, frame)
+    assert client._get_memoized_frame("a") is frame
+    client._memoize_frame("c", frame)
+
+    assert list(client._frame_cache) == ["a", "c"]
+
+
+def test_memory_cache_disabled_with_zero_entries(tmp_path, monkeypatch):
+    """memory_entries=0 keeps nothing in memory; repeat requests re-read SQLite."""
+    monkeypatch.setattr(
+        cfg,
+        "cache_config",
+        lambda: {"enabled": True, "path": str(tmp_path), "memory_entries": 0},
+    )
+    api_response = {"properties": {"parameter": {"T2M": {"20230101": 25.0}}}}
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=api_response)
+        client = PowerClient(temporal_api="daily")
+        kwargs = dict(lat=10.0, lon=20.0, start="20230101", end="20230101", params=["T2M"])
+        first = client.get_point_data(**kwargs)
+        second = client.get_point_data(**kwargs)
+        assert m.call_count == 1
+
+    assert not client._frame_cache
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_mutating_result_does_not_touch_memory_cache(mock_cache_config):
+    """Frames returned for a sub-window are independent of the cached frame."""
+    api_response = {"properties": {"parameter": {"T2M": {"20230101": 25.0, "20230102": 26.0}}}}
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=api_response)
+        client = PowerClient(temporal_api="daily")
+        client.get_point_data(lat=10.0, lon=20.0, start="20230101", end="20230102", params=["T2M"])
+
+        window = client.get_point_data(
+            lat=10.0, lon=20.0, start="20230102", end="20230102", params=["T2M"]
+        )
+        assert window.index.tolist() == [pd.Timestamp("2023-01-02")]
+        window.iloc[0, 0] = -1.0
+
+        again = client.get_point_data(
+            lat=10.0, lon=20.0, start="20230101", end="20230102", params=["T2M"]
+        )
+        assert m.call_count == 1
+        assert again["T2M"].tolist() == [25.0, 26.0]
+
+
+def test_missing_edges_fetched_within_connection_limit(mock_cache_config):
+    """Leading and trailing gaps are both fetched, never exceeding the connection cap."""
+    import threading
+    import time
+
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def respond(request, context):
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.pop()
+        day = request.qs["start"][0]
+        return {"properties": {"parameter": {"T2M": {day: float(day[-1])}}}}
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=respond)
+        client = PowerClient(temporal_api="daily")
+        client.connection_slots = threading.BoundedSemaphore(1)
+        client.get_point_data(
+            lat=10.0, lon=20.0, start="20230102", end="20230102", params=["T2M"]
+        )
+        df = client.get_point_data(
+            lat=10.0, lon=20.0, start="20230101", end="20230103", params=["T2M"]
+        )
+
+    assert m.call_count == 3
+    assert max(peak) == 1
+    assert df["T2M"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_merge_and_deduplicate_orders_and_prefers_first_frame():
+    """Disjoint frames are stitched in date order; on overlap the earlier frame wins."""
+    from aidweather.client import _merge_and_deduplicate
+
+    def frame(days, value):
+        idx = pd.DatetimeIndex(pd.to_datetime(days), name="date")
+        return pd.DataFrame({"T2M": [value] * len(days), "RH2M": [0.0] * len(days)}, index=idx)
+
+    cached = frame(["2023-01-02"], 2.0)
+    leading = frame(["2023-01-01"], 1.0)[["RH2M", "T2M"]]
+    trailing = frame(["2023-01-03"], 3.0)
+
+    merged = _merge_and_deduplicate([cached, leading, trailing])
+    assert list(merged.columns) == ["T2M", "RH2M"]
+    assert merged["T2M"].tolist() == [1.0, 2.0, 3.0]
+
+    overlapping = _merge_and_deduplicate([cached, frame(["2023-01-02", "2023-01-03"], 9.0)])
+    assert overlapping["T2M"].tolist() == [2.0, 9.0]
+
+
+def test_convert_df_to_cacheable_json_leaves_input_untouched():
+    """Serialising for the cache must not relabel or fill the caller's frame."""
+    from aidweather.client import _convert_df_to_cacheable_json
+
+    idx = pd.DatetimeIndex(pd.to_datetime(["2023-01-01", "2023-01-02"]), name="date")
+    df = pd.DataFrame({"T2M": [10.5, float("nan")]}, index=idx)
+    original = df.copy()
+
+    result = _convert_df_to_cacheable_json(df, "daily")
+
+    assert result == {"properties": {"parameter": {"T2M": {"20230101": 10.5, "20230102": -999.0}}}}
+    pd.testing.assert_frame_equal(df, original)
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_get_date_ranges_to_fetch_edges(shuffle):
+    """Missing leading/trailing edges are derived from the cached span, sorted or not."""
+    from aidweather.client import _get_date_ranges_to_fetch
+
+    days = pd.date_range("2023-01-03", "2023-01-05", name="date")
+    if shuffle:
+        days = days[[2, 0, 1]]
+    cached = pd.DataFrame({"T2M": [1.0, 2.0, 3.0]}, index=days)
+
+    ranges = _get_date_ranges_to_fetch(
+        pd.Timestamp("2023-01-01"), pd.Timestamp("2023-01-07"), cached, "daily"
+    )
+
+    assert ranges == [
+        (pd.Timestamp("2023-01-01"), pd.Timestamp("2023-01-02")),
+        (pd.Timestamp("2023-01-06"), pd.Timestamp("2023-01-07")),
+    ]
+    assert _get_date_ranges_to_fetch(days.min(), days.max(), cached, "daily") == []
+
+
+def test_filter_df_by_date_matches_label_slicing():
+    """Positional slicing on sorted frames returns exactly what .loc would."""
+    from aidweather.client import _filter_df_by_date
+
+    idx = pd.date_range("2023-01-01", periods=48, freq="h", name="date")
+    df = pd.DataFrame({"T2M": range(48)}, index=idx)
+    start, end = pd.Timestamp("2023-01-01 05:30"), pd.Timestamp("2023-01-02 00:00")
+
+    pd.testing.assert_frame_equal(_filter_df_by_date(df, start, end), df.loc[start:end])
+    # Unsorted frames take the .loc fallback (bounds must then be labels).
+    shuffled = df.iloc[[3, 1, 2, 0]]
+    lo, hi = idx[1], idx[2]
+    assert list(_filter_df_by_date(shuffled, lo, hi).index) == [idx[1], idx[2]]
+
+
+def test_parse_payload_date_extends_hourly_end_bound():
+    """Day-granular hourly end bounds cover the whole final day; other bounds are literal."""
+    from aidweather.client import _parse_payload_date
+
+    assert _parse_payload_date("20230101", "hourly", is_end=True) == pd.Timestamp("2023-01-01 23:00")
+    assert _parse_payload_date("20230101", "hourly") == pd.Timestamp("2023-01-01")
+    assert _parse_payload_date("2023010105", "hourly", is_end=True) == pd.Timestamp("2023-01-01 05:00")
+    assert _parse_payload_date("20230101", "daily", is_end=True) == pd.Timestamp("2023-01-01")
+
+
+def test_cache_dir_override_persists_across_clients(tmp_path, monkeypatch):
+    """`cache_dir` enables the on-disk cache in that directory even when the
+    configuration disables it, and a fresh client (e.g. after a notebook
+    restart) is served from the database without touching the network."""
+    monkeypatch.setattr(
+        cfg, "cache_config", lambda: {"enabled": False, "path": str(tmp_path / "cfg")}
+    )
+    cache_dir = tmp_path / "project_cache"
+    api_response = {"properties": {"parameter": {"T2M": {"20230101": 25.0}}}}
+
+    with requests_mock.Mocker() as m:
+        m.get(requests_mock.ANY, json=api_response)
+        first = PowerClient(cache_dir=cache_dir).get_point_data(
+            lat=1.0, lon=2.0, start="20230101", end="20230101", params=["T2M"]
+        )
+        second = PowerClient(cache_dir=str(cache_dir)).get_point_data(
+            lat=1.0, lon=2.0, start="20230101", end="20230101", params=["T2M"]
+        )
+        assert m.call_count == 1
+
+    assert (cache_dir / "aidweather_cache.db").exists()
+    assert not (tmp_path / "cfg").exists()
+    pd.testing.assert_frame_equal(first, second)
@@ -342,3 +342,36 @@ def test_hourly_transect_rejects_daily_only_param():
             params=["GWETTOP"],
             num_points=3,
         )
+
+
+def test_format_date_accepts_parsed_and_raw_values():
+    """Timestamps and datetimes are formatted directly; strings still go through strict parsing."""
+    from datetime import datetime
+
+    import pandas as pd
+
+    client = PowerClient()
+    assert client._format_date(pd.Timestamp("2023-03-05 13:00")) == "20230305"
+    assert client._format_date(datetime(2023, 3, 5)) == "20230305"
+    assert client._format_date("2023-03-05") == "20230305"
+    with pytest.raises(AmbiguousDateError):
+        client._format_date("05/03/2023")
+
+
+def test_param_checks_repeat_on_every_call():
+    """Parameter checks warn and raise on every call, not just the first."""
+    hourly = PowerClient(temporal_api="hourly")
+    for _ in range(2):
+        with pytest.raises(ValueError, match="GWETTOP.*daily-only"):
+            hourly._validate_inputs(["T2M", "GWETTOP"], "20230101", "20230101")
+        with pytest.warns(UserWarning, match="INVALID_PARAM"):
+            hourly._validate_inputs(["INVALID_PARAM"], "20230101", "20230101")
+
+
+def test_daily_only_params_precomputed_from_metadata():
+    """Hourly clients derive the daily-only set once from availability.hourly_start."""
+    hourly = PowerClient(temporal_api="hourly")
+    assert {"GWETTOP", "GWETROOT", "GWETPROF"} <= hourly._daily_only_params
+    assert "T2M" not in hourly._daily_only_params
+    assert hourly._daily_only_params <= hourly._known_params
+    assert PowerClient(temporal_api="daily")._daily_only_params == frozenset()